@@ -11,59 +11,94 @@ Class
 import sys
 import os
 import argparse
+import functools
 import re
-import subprocess
 
+# Research-related keywords
+RESEARCH_KEYWORDS = [
+    "research", "find", "search", "look up", "investigate",
+    "analyze", "study", "explore", "learn about"
+]
+
+# Calculation-related keywords
+CALC_KEYWORDS = [
+    "calculate", "compute", "solve", "evaluate", "what is",
+    "how much", "add", "subtract", "multiply", "divide"
+]
+
+# Creative-related keywords
+CREATIVE_KEYWORDS = [
+    "create", "generate", "write", "compose", "design",
+    "develop", "make", "build", "draft"
+]
+
+def _split_keywords(keywords):
+    """
+    Split a keyword list into a frozenset of single words and a compiled
+    pattern for the multi-word phrases (or None when there are none).
+    """
+    words = frozenset(kw for kw in keywords if " " not in kw)
+    phrases = [kw for kw in keywords if " " in kw]
+    phrase_re = None
+    if phrases:
+        phrase_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, phrases)) + r')\b')
+    return words, phrase_re
+
+@functools.lru_cache(maxsize=1)
+def _build_matchers():
+    """
+    Build the tokenizer and category matchers on first use.
+
+    Compiling lazily keeps regex construction entirely off the CLI cold
+    paths that never classify (--help, or an explicit --mode); the cost is
+    paid at most once per process, on the first detect_task_type call.
+
+    Returns:
+        A (token_re, categories) tuple, where categories is a precedence-
+        ordered tuple of (mode, word set, phrase pattern) entries.
+    """
+    # Tokenizer for splitting a task into words (equivalent to \b boundaries)
+    token_re = re.compile(r"\w+")
+
+    # Single-word keywords become C-level set lookups against the tokenized
+    # task; only the few multi-word phrases still need a regex scan.
+    # Creative and calculation keywords take precedence over research ones,
+    # mirroring the original category check order.
+    categories = (
+        ("multi",) + _split_keywords(CREATIVE_KEYWORDS),
+        ("single",) + _split_keywords(CALC_KEYWORDS),
+        ("multi",) + _split_keywords(RESEARCH_KEYWORDS),
+    )
+    return token_re, categories
+
+@functools.lru_cache(maxsize=1024)
 def detect_task_type(task):
     """
     Automatically detect the type of task and set the appropriate mode.
-    
+
+    Classification is memoized, so repeated calls for the same task string
+    (e.g. when used as a library by a long-running process) skip the scan.
+
     Args:
         task: The task description
-        
+
     Returns:
         The appropriate mode for the task
     """
+    token_re, categories = _build_matchers()
+
+    # Lowercase and tokenize once, then check categories by set intersection
+    task_lower = task.lower()
+    tokens = frozenset(token_re.findall(task_lower))
+
+    for mode, words, phrase_re in categories:
+        if not words.isdisjoint(tokens):
+            return mode
+        if phrase_re is not None and phrase_re.search(task_lower):
+            return mode
+
     # Default to auto mode
-    mode = "auto"
-    
-    # Research-related keywords
-    research_keywords = [
-        "research", "find", "search", "look up", "investigate", 
-        "analyze", "study", "explore", "learn about"
-    ]
-    
-    # Calculation-related keywords
-    calc_keywords = [
-        "calculate", "compute", "solve", "evaluate", "what is", 
-        "how much", "add", "subtract", "multiply", "divide"
-    ]
-    
-    # Creative-related keywords
-    creative_keywords = [
-        "create", "generate", "write", "compose", "design", 
-        "develop", "make", "build", "draft"
-    ]
-    
-    # Check for research-related tasks
-    for keyword in research_keywords:
-        if re.search(r'\b' + keyword + r'\b', task.lower()):
-            mode = "multi"
-            break
-            
-    # Check for calculation-related tasks
-    for keyword in calc_keywords:
-        if re.search(r'\b' + keyword + r'\b', task.lower()):
-            mode = "single"
-            break
-            
-    # Check for creative-related tasks
-    for keyword in creative_keywords:
-        if re.search(r'\b' + keyword + r'\b', task.lower()):
-            mode = "multi"
-            break
-    
-    return mode
+    return "auto"
 
 def main():
     """
@@ -108,36 +143,39 @@ def main():
     
     # Get the parent directory (where jafs and anus directories are)
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Build the command
-    cmd = [
-        "python", 
-        "-m", 
-        "jafs.main"
-    ]
-    
+
+    # Make the jafs package importable instead of spawning a child
+    # interpreter: skips a second Python startup and module re-import
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+
+    # Build the argument list for jafs.main
+    jafs_args = []
+
     # Add mode if specified
     if mode:
-        cmd.extend(["--mode", mode])
-    
+        jafs_args.extend(["--mode", mode])
+
     # Add verbose flag if specified
     if args.verbose:
-        cmd.append("--verbose")
-    
+        jafs_args.append("--verbose")
+
     # Add task
-    cmd.extend(["--task", task])
-    
-    # Set PYTHONPATH to the parent directory
-    env = os.environ.copy()
-    env["PYTHONPATH"] = parent_dir
-    
-    # Print the command if verbose
+    jafs_args.extend(["--task", task])
+
+    # Print the call if verbose
     if args.verbose:
-        print(f"Executing: {' '.join(cmd)}")
-        print(f"PYTHONPATH: {parent_dir}")
-    
-    # Execute the command
-    subprocess.run(cmd, env=env, cwd=parent_dir)
+        print(f"Running in-process: jafs.main {' '.join(jafs_args)}")
+
+    # Run from the repo root, matching the old subprocess (cwd=parent_dir)
+    # behavior so the default --config config.yaml still resolves no matter
+    # where the launcher was invoked from
+    os.chdir(parent_dir)
+
+    # Call the entry point directly in this process
+    from jafs.main import main as jafs_main
+    sys.argv = ["jafs.main"] + jafs_args
+    jafs_main()
 
 if __name__ == "__main__":
     main()
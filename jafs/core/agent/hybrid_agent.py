@@ -4,12 +4,74 @@ Hybrid Agent module that combines single and multi-agent capabilities.
 This agent can dynamically switch between single and multi-agent modes based on task complexity.
 """
 
+import concurrent.futures
+import functools
 import logging
 import re
 from typing import Dict, Any, List, Tuple, Optional
 
 from anus.core.agent.tool_agent import ToolAgent
 
+# Operation patterns used by complexity assessment, compiled once at import.
+# Each entry is (pattern, score per match). Case-insensitive matching lets
+# the scorer walk the original task string without a lowercased copy.
+_OPERATION_PATTERNS = [
+    (re.compile(r'(calculate|compute|evaluate)', re.IGNORECASE), 1.0),  # Basic calculations
+    (re.compile(r'(search|find|look up)', re.IGNORECASE), 1.0),  # Search operations
+    (re.compile(r'(count|process|analyze|transform)\s+text', re.IGNORECASE), 1.0),  # Text operations
+    (re.compile(r'run\s+code|execute', re.IGNORECASE), 1.5),  # Code execution
+    (re.compile(r'compare|contrast|evaluate', re.IGNORECASE), 2.0),  # Analysis operations
+    (re.compile(r'optimize|improve|enhance', re.IGNORECASE), 2.5),  # Optimization tasks
+    (re.compile(r'and|then|after|before', re.IGNORECASE), 1.0),  # Task chaining
+    (re.compile(r'if|when|unless|otherwise', re.IGNORECASE), 1.5),  # Conditional operations
+    (re.compile(r'all|every|each', re.IGNORECASE), 1.0),  # Comprehensive operations
+    (re.compile(r'most|best|optimal', re.IGNORECASE), 1.5)  # Decision making
+]
+
+# Keyword patterns hinting that a specific tool will be needed, one
+# case-insensitive alternation per tool (plain substring semantics)
+_TOOL_PATTERNS = {
+    'calculator': re.compile(r'calculate|compute|evaluate|math', re.IGNORECASE),
+    'search': re.compile(r'search|find|look up|query', re.IGNORECASE),
+    'text': re.compile(r'text|string|characters|words', re.IGNORECASE),
+    'code': re.compile(r'code|execute|run|python', re.IGNORECASE)
+}
+
+@functools.lru_cache(maxsize=1024)
+def _task_complexity(task: str) -> float:
+    """
+    Score the complexity of a task description between 0 and 10.
+
+    The score is a pure function of the task string, so results are memoized
+    and repeated assessments of the same task skip the scans entirely.
+    """
+    complexity = 0.0
+
+    # Add complexity for each operation found; the case-insensitive patterns
+    # walk the original string, so no lowercased copy is allocated
+    for pattern, score in _OPERATION_PATTERNS:
+        matches = pattern.findall(task)
+        complexity += score * len(matches)
+
+    # Add complexity for length of task description
+    words = task.split()
+    complexity += len(words) * 0.1  # 0.1 points per word
+
+    # Add complexity for special characters (potential complex expressions)
+    special_chars = sum(1 for c in task if not c.isalnum() and not c.isspace())
+    complexity += special_chars * 0.2
+
+    # Add complexity for multiple tools needed
+    tools_needed = 0
+    for tool_name, pattern in _TOOL_PATTERNS.items():
+        if pattern.search(task):
+            tools_needed += 1
+
+    complexity += tools_needed * 1.5
+
+    # Cap the complexity at 10
+    return min(10.0, complexity)
+
 class HybridAgent(ToolAgent):
     """
     A hybrid agent that can switch between single and multi-agent modes.
@@ -36,71 +98,25 @@ class HybridAgent(ToolAgent):
         super().__init__(name=name, max_iterations=max_iterations, tools=tools, **kwargs)
         self.mode = "auto"
         
-        # Specialized agents for multi-agent mode
-        self.specialized_agents = {
-            "researcher": ToolAgent(name="researcher", tools=tools),
-            "planner": ToolAgent(name="planner", tools=tools),
-            "executor": ToolAgent(name="executor", tools=tools),
-            "critic": ToolAgent(name="critic", tools=tools)
-        }
+        # Specialized agents for multi-agent mode. The four constructions
+        # are independent of one another (each agent loads its own tool
+        # set), so they are built concurrently instead of one after another.
+        roles = ("researcher", "planner", "executor", "critic")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(roles)) as pool:
+            agents = pool.map(lambda role: ToolAgent(name=role, tools=tools), roles)
+        self.specialized_agents = dict(zip(roles, agents))
     
     def _assess_complexity(self, task: str) -> float:
         """
         Assess the complexity of a task.
-        
+
         Args:
             task: The task description.
-            
+
         Returns:
             A complexity score between 0 and 10.
         """
-        complexity = 0.0
-        
-        # Check for multiple operations
-        operations = [
-            (r'(calculate|compute|evaluate)', 1.0),  # Basic calculations
-            (r'(search|find|look up)', 1.0),  # Search operations
-            (r'(count|process|analyze|transform)\s+text', 1.0),  # Text operations
-            (r'run\s+code|execute', 1.5),  # Code execution
-            (r'compare|contrast|evaluate', 2.0),  # Analysis operations
-            (r'optimize|improve|enhance', 2.5),  # Optimization tasks
-            (r'and|then|after|before', 1.0),  # Task chaining
-            (r'if|when|unless|otherwise', 1.5),  # Conditional operations
-            (r'all|every|each', 1.0),  # Comprehensive operations
-            (r'most|best|optimal', 1.5)  # Decision making
-        ]
-        
-        # Add complexity for each operation found
-        for pattern, score in operations:
-            matches = re.findall(pattern, task.lower())
-            complexity += score * len(matches)
-        
-        # Add complexity for length of task description
-        words = task.split()
-        complexity += len(words) * 0.1  # 0.1 points per word
-        
-        # Add complexity for special characters (potential complex expressions)
-        special_chars = sum(1 for c in task if not c.isalnum() and not c.isspace())
-        complexity += special_chars * 0.2
-        
-        # Add complexity for multiple tools needed
-        tool_keywords = {
-            'calculator': ['calculate', 'compute', 'evaluate', 'math'],
-            'search': ['search', 'find', 'look up', 'query'],
-            'text': ['text', 'string', 'characters', 'words'],
-            'code': ['code', 'execute', 'run', 'python']
-        }
-        
-        tools_needed = 0
-        task_lower = task.lower()
-        for tool_name, keywords in tool_keywords.items():
-            if any(kw in task_lower for kw in keywords):
-                tools_needed += 1
-            
-        complexity += tools_needed * 1.5
-        
-        # Cap the complexity at 10
-        return min(10.0, complexity)
+        return _task_complexity(task)
     
     def execute(self, task: str, **kwargs) -> Dict[str, Any]:
         """
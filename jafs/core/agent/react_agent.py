@@ -8,6 +8,25 @@ import logging
 
 from anus.core.agent.base_agent import BaseAgent
 
+# Human-readable descriptions for text tool operations, built once at import
+# instead of per answer
+_OPERATION_DESCRIPTIONS = {
+    "count": "characters in",
+    "reverse": "reversed",
+    "uppercase": "in uppercase",
+    "lowercase": "in lowercase",
+    "capitalize": "capitalized",
+    "wordcount": "words in"
+}
+
+# Section templates for multi-agent answers, in presentation order
+_AGENT_SECTIONS = (
+    ("researcher", "Research findings:\n{}"),
+    ("planner", "Execution plan:\n{}"),
+    ("executor", "Execution results:\n{}"),
+    ("critic", "Analysis and recommendations:\n{}")
+)
+
 class ReactAgent(BaseAgent):
     """
     A reasoning agent that follows the React paradigm (Reasoning and Acting).
@@ -207,14 +226,7 @@ class ReactAgent(BaseAgent):
                         text_result = result["result"]
                         fun_fact = result.get("fun_fact", "")
                         
-                        operation_description = {
-                            "count": "characters in",
-                            "reverse": "reversed",
-                            "uppercase": "in uppercase",
-                            "lowercase": "in lowercase",
-                            "capitalize": "capitalized",
-                            "wordcount": "words in"
-                        }.get(operation, operation)
+                        operation_description = _OPERATION_DESCRIPTIONS.get(operation, operation)
                         
                         fun_fact_text = f"\n\n{fun_fact}" if fun_fact else ""
                         
@@ -239,28 +251,15 @@ class ReactAgent(BaseAgent):
                     if "agent_results" in result:
                         agent_results = result["agent_results"]
                         final_answer = []
-                        
-                        # Process each agent's contribution
-                        if "researcher" in agent_results:
-                            research = agent_results["researcher"].get("answer", "")
-                            if research:
-                                final_answer.append(f"Research findings:\n{research}")
-                        
-                        if "planner" in agent_results:
-                            plan = agent_results["planner"].get("answer", "")
-                            if plan:
-                                final_answer.append(f"Execution plan:\n{plan}")
-                        
-                        if "executor" in agent_results:
-                            execution = agent_results["executor"].get("answer", "")
-                            if execution:
-                                final_answer.append(f"Execution results:\n{execution}")
-                        
-                        if "critic" in agent_results:
-                            critique = agent_results["critic"].get("answer", "")
-                            if critique:
-                                final_answer.append(f"Analysis and recommendations:\n{critique}")
-                        
+
+                        # Process each agent's contribution via the section
+                        # template table instead of a branch per role
+                        for role, template in _AGENT_SECTIONS:
+                            if role in agent_results:
+                                answer = agent_results[role].get("answer", "")
+                                if answer:
+                                    final_answer.append(template.format(answer))
+
                         # Combine all parts with proper formatting
                         if final_answer:
                             return "\n\n".join(final_answer)
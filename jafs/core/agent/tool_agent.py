@@ -9,6 +9,16 @@ import re
 
 from anus.core.agent.react_agent import ReactAgent
 
+# Priority-ordered direct-response fallbacks: the first entry whose patterns
+# all match the task wins. Case-insensitive patterns avoid lowercasing the
+# task, and the table is scanned in one pass instead of an if/elif ladder.
+_DIRECT_RESPONSES = (
+    ((re.compile(r'what is', re.IGNORECASE), re.compile(r'capital of france', re.IGNORECASE)),
+     "The capital of France is Paris."),
+    ((re.compile(r'what is', re.IGNORECASE),),
+     "I don't have specific information about '{task}'. Please try a different question or use one of the available tools."),
+)
+
 class ToolAgent(ReactAgent):
     """
     An agent that can use tools to interact with its environment.
@@ -83,8 +93,10 @@ class ToolAgent(ReactAgent):
         Returns:
             A tuple of (action_name, action_input).
         """
-        task = context['task'].lower()
-        
+        # The action patterns below are all case-insensitive, so the task is
+        # matched as-is without allocating a lowercased copy
+        task = context['task']
+
         # Check for calculator tasks
         calc_pattern = r'calculate\s+(.+)$'
         calc_match = re.search(calc_pattern, task, re.IGNORECASE)
@@ -140,11 +152,10 @@ class ToolAgent(ReactAgent):
         logging.info(f"No specific tool matched for task: {task}")
         
         # For simple questions, try to provide a direct answer
-        if "what is" in task.lower() and "capital of france" in task.lower():
-            return "direct_response", {"response": "The capital of France is Paris."}
-        elif "what is" in task.lower():
-            return "direct_response", {"response": f"I don't have specific information about '{task}'. Please try a different question or use one of the available tools."}
-        
+        for patterns, template in _DIRECT_RESPONSES:
+            if all(pattern.search(task) for pattern in patterns):
+                return "direct_response", {"response": template.format(task=task)}
+
         # Default fallback
         return "direct_response", {"response": f"I'm not sure how to process '{task}'. Please try a more specific request or use one of the available tools."}
     
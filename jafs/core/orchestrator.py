@@ -7,41 +7,66 @@ lifecycle and coordinates task execution across multiple agents.
 Behind every successful JAFS is a well-designed Orchestrator.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
+from collections import OrderedDict, deque
+from itertools import islice
+import copy
+import json
 import logging
+import re
+import sys
+import threading
 import yaml
 import os
 import time
 import random
+import uuid
+
+try:
+    # libyaml C bindings: substantially faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from jafs.core.agent import BaseAgent, HybridAgent
 from jafs.core.memory import ShortTermMemory, LongTermMemory
 
-# Create a custom logger for JAFS-specific wisdom
-class JAFSLogger(logging.Logger):
-    """Custom logger that occasionally adds JAFS wisdom to log messages."""
-    
-    _wisdom = [
+# Interned mode and role strings: comparisons against these hit CPython's
+# pointer-equality fast path instead of byte-by-byte compares
+_MODE_SINGLE, _MODE_MULTI, _MODE_AUTO = map(sys.intern, ("single", "multi", "auto"))
+_DEFAULT_ROLES = tuple(map(sys.intern, ("researcher", "planner", "executor", "critic")))
+
+# Dedicated RNG for wisdom injection: keeps per-log-line randomness off the
+# shared global random instance and its lock
+_rng = random.Random()
+
+# Filter that occasionally adds JAFS wisdom to log messages. A filter on
+# this logger only runs for records that passed the level check, and —
+# unlike the previous Logger subclass registered via setLoggerClass — it
+# does not change logger behavior for unrelated modules.
+class JAFSWisdomFilter(logging.Filter):
+    """Log filter that occasionally appends JAFS wisdom to records."""
+
+    _wisdom = (
         "JAFS Wisdom: Always test your backend thoroughly before deployment.",
         "JAFS Wisdom: Sometimes a little assistance is all you need.",
         "JAFS Wisdom: Keep your interfaces clean and well-documented.",
         "JAFS Wisdom: A robust architecture prevents unexpected issues.",
         "JAFS Wisdom: Even the backend deserves some love and attention."
-    ]
-    
-    def info(self, msg, *args, **kwargs):
-        if random.random() < 0.1:  # 10% chance
-            msg = f"{msg} - {random.choice(self._wisdom)}"
-        super().info(msg, *args, **kwargs)
-    
-    def debug(self, msg, *args, **kwargs):
-        if random.random() < 0.2:  # 20% chance
-            msg = f"{msg} - {random.choice(self._wisdom)}"
-        super().debug(msg, *args, **kwargs)
+    )
+
+    # Chance of wisdom per level: 10% for info, 20% for debug
+    _chances = {logging.INFO: 0.1, logging.DEBUG: 0.2}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        chance = self._chances.get(record.levelno, 0.0)
+        if chance and _rng.random() < chance:
+            record.msg = f"{record.getMessage()} - {self._wisdom[_rng.randrange(len(self._wisdom))]}"
+            record.args = None
+        return True
 
-# Register our custom logger
-logging.setLoggerClass(JAFSLogger)
 logger = logging.getLogger("jafs.orchestrator")
+logger.addFilter(JAFSWisdomFilter())
 
 class AgentOrchestrator:
     """
@@ -64,11 +89,50 @@ class AgentOrchestrator:
         Args:
             config_path: Path to the configuration file.
         """
+        self.config_path = config_path
+        self._config_stat: Optional[Tuple[float, int]] = None
         self.config = self._load_config(config_path)
         self.agents: Dict[str, BaseAgent] = {}
-        self.primary_agent = self._create_primary_agent()
+        # The primary agent (and its memories and specialized agents) is
+        # expensive to build, so it is created lazily on first use rather
+        # than here: read-only commands like config or history never pay
+        # for agent construction.
+        self._primary_agent: Optional[HybridAgent] = None
+        # Cached list_agents output; invalidated whenever the agent pool
+        # changes, so repeat listings skip the per-agent dict rebuild
+        self._agent_list_cache: Optional[List[Dict[str, Any]]] = None
         self.last_result: Dict[str, Any] = {}
-        self.task_history: List[Dict[str, Any]] = []
+        # Bounded history: old records fall off the front instead of the
+        # list growing without limit over a long session
+        history_config = self.config.get("history", {})
+        max_history = history_config.get("max_entries", 1000)
+        self.task_history: "deque[Dict[str, Any]]" = deque(maxlen=max_history)
+
+        # Optional on-disk history: each record is appended as one JSONL
+        # line when it completes (O(1) per task regardless of history
+        # length), and only the tail is read back on startup
+        self._history_path = history_config.get("storage_path")
+        if self._history_path:
+            history_dir = os.path.dirname(self._history_path)
+            if history_dir:
+                os.makedirs(history_dir, exist_ok=True)
+            self._load_history_tail(self._history_path, max_history)
+        # History records are compact summaries; the full result dicts
+        # (which can carry large contexts) live in this bounded FIFO table
+        # keyed by result_id, so memory stays O(cap) rather than growing
+        # with every full result the session produces
+        self._full_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._full_results_size = 64
+
+        # Recent results keyed by (task, mode), bounded LRU with a TTL so
+        # stale results eventually re-execute. The in-flight table lets
+        # concurrent identical requests share a single execution
+        # (single-flight) instead of each hitting the agent.
+        self._result_cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._result_cache_size = 128
+        self._result_cache_ttl = self.config.get("cache", {}).get("ttl", 300)
+        self._inflight: Dict[Tuple[str, str], threading.Event] = {}
+        self._cache_lock = threading.Lock()
         
         # Easter eggs for internal task names
         self._easter_egg_tasks = {
@@ -78,39 +142,120 @@ class AgentOrchestrator:
             "optimize": "Making JAFS more responsive and flexible...",
             "expand": "Expanding JAFS capabilities..."
         }
-        
+
+        # One compiled alternation scans the task for all easter-egg
+        # keywords in a single pass
+        self._easter_egg_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self._easter_egg_tasks)) + r")\b",
+            re.IGNORECASE
+        )
+
+
         logger.info("JAFS Orchestrator initialized and ready for action")
-    
-    def execute_task(self, task: str, mode: Optional[str] = None) -> Dict[str, Any]:
+
+    @property
+    def primary_agent(self) -> HybridAgent:
+        """
+        The primary agent, created on first access.
+        """
+        if self._primary_agent is None:
+            self._primary_agent = self._create_primary_agent()
+        return self._primary_agent
+
+    def execute_task(self, task: str, mode: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Execute a task using an appropriate agent.
-        
+
         Args:
             task: The task description to execute.
             mode: Execution mode ("single" or "multi"). If None, uses the config default.
-            
+            use_cache: Whether the result cache may serve this task. Pass
+                False to force a fresh execution.
+
         Returns:
             The execution result.
         """
-        # Use config default if mode not specified
+        # Pick up on-disk config edits when hot reload is enabled (one
+        # stat call when nothing changed)
+        if self.config.get("hot_reload", False):
+            self.reload_config_if_changed()
+
+        # Use config default if mode not specified; intern the mode so the
+        # equality checks downstream compare by pointer
         if mode is None:
-            mode = self.config.get("agent", {}).get("mode", "single")
-        
+            mode = self.config.get("agent", {}).get("mode", _MODE_SINGLE)
+        mode = sys.intern(mode)
+
+        key = (task, mode)
+
+        # Cache bypass: execute fresh and refresh the stored entry
+        if not use_cache:
+            result = self._execute_task_uncached(task, mode)
+            with self._cache_lock:
+                self._result_cache[key] = (result, time.time())
+                if len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+            return result
+
+        # Fast path: return a cached unexpired result, or wait for an
+        # identical in-flight execution to finish and share its result
+        while True:
+            with self._cache_lock:
+                entry = self._result_cache.get(key)
+                if entry is not None:
+                    cached, stored_at = entry
+                    if time.time() - stored_at <= self._result_cache_ttl:
+                        self._result_cache.move_to_end(key)
+                        logger.info("JAFS served identical task from the result cache")
+                        # Hand out a copy so callers cannot mutate the
+                        # cached result (or its aliases) in place
+                        return copy.deepcopy(cached)
+                    del self._result_cache[key]
+                leader_event = self._inflight.get(key)
+                if leader_event is None:
+                    # No one is executing this task yet: we become the leader
+                    leader_event = threading.Event()
+                    self._inflight[key] = leader_event
+                    break
+            leader_event.wait()
+
+        try:
+            result = self._execute_task_uncached(task, mode)
+            with self._cache_lock:
+                self._result_cache[key] = (result, time.time())
+                if len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+            return result
+        finally:
+            with self._cache_lock:
+                del self._inflight[key]
+            leader_event.set()
+
+    def _execute_task_uncached(self, task: str, mode: str) -> Dict[str, Any]:
+        """
+        Execute a task with the primary agent, bypassing the result cache.
+
+        Args:
+            task: The task description to execute.
+            mode: Execution mode ("single" or "multi").
+
+        Returns:
+            The execution result.
+        """
         start_time = time.time()
         
         # Check for easter egg task names
         display_task = task
-        for keyword, message in self._easter_egg_tasks.items():
-            if keyword.lower() in task.lower().split():
-                display_task = message
-                logger.info(f"Easter egg activated: {message}")
-                break
+        match = self._easter_egg_re.search(task)
+        if match:
+            display_task = self._easter_egg_tasks[match.group(1).lower()]
+            logger.info("Easter egg activated: %s", display_task)
         
         # Log the task
-        if mode == "multi":
-            logger.info(f"JAFS expanding to handle multiple agents for task: {display_task}")
+        if mode == _MODE_MULTI:
+            logger.info("JAFS expanding to handle multiple agents for task: %s", display_task)
         else:
-            logger.info(f"JAFS processing task: {display_task}")
+            logger.info("JAFS processing task: %s", display_task)
         
         # Execute the task with the primary agent
         result = self.primary_agent.execute(task, mode=mode)
@@ -118,27 +263,37 @@ class AgentOrchestrator:
         # Record execution time
         execution_time = time.time() - start_time
         
-        # Create a task record
+        # Create a compact task record; the full result is kept separately
+        # in the bounded result table and fetched on demand by result_id
+        result_id = uuid.uuid4().hex
         task_record = {
             "task": task,
             "mode": mode,
             "start_time": start_time,
             "execution_time": execution_time,
             "status": "completed",
-            "result": result
+            "answer": str(result.get("answer", ""))[:200],
+            "result_id": result_id
         }
-        
+
         # Add to task history
         self.task_history.append(task_record)
+        self._full_results[result_id] = result
+        if len(self._full_results) > self._full_results_size:
+            self._full_results.popitem(last=False)
+
+        # Persist the record (append-only, best effort)
+        if self._history_path:
+            self._append_history_record(task_record)
         
         # Update last result
         self.last_result = result
         
         # Log completion
         if execution_time > 10:
-            logger.info(f"JAFS finished after {execution_time:.2f}s - that was quite a complex task!")
+            logger.info("JAFS finished after %.2fs - that was quite a complex task!", execution_time)
         else:
-            logger.info(f"JAFS completed task in {execution_time:.2f}s")
+            logger.info("JAFS completed task in %.2fs", execution_time)
         
         return result
     
@@ -149,8 +304,13 @@ class AgentOrchestrator:
         Returns:
             A list of agent descriptions.
         """
+        # Fast path: the pool rarely changes, so reuse the cached listing.
+        # Entries are copied so callers cannot mutate the cache.
+        if self._agent_list_cache is not None:
+            return [entry.copy() for entry in self._agent_list_cache]
+
         agent_list = []
-        
+
         # Add primary agent
         agent_list.append({
             "id": self.primary_agent.id,
@@ -170,9 +330,10 @@ class AgentOrchestrator:
                 })
         
         if len(agent_list) > 3:
-            logger.debug(f"JAFS is managing {len(agent_list)} agents simultaneously")
-        
-        return agent_list
+            logger.debug("JAFS is managing %d agents simultaneously", len(agent_list))
+
+        self._agent_list_cache = agent_list
+        return [entry.copy() for entry in agent_list]
     
     def get_task_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -185,9 +346,71 @@ class AgentOrchestrator:
             A list of task history records.
         """
         if limit > 50:
-            logger.warning(f"Requesting {limit} history items? That's a deep dive into JAFS history!")
-        
-        return self.task_history[-limit:]
+            logger.warning("Requesting %d history items? That's a deep dive into JAFS history!", limit)
+
+        # Slice the tail of the deque without copying the whole history
+        start = max(0, len(self.task_history) - limit)
+        return list(islice(self.task_history, start, None))
+
+    def _load_history_tail(self, path: str, limit: int) -> None:
+        """
+        Rehydrate the last `limit` history records from the JSONL file.
+
+        Seeks to a bounded window at the end of the file instead of
+        scanning it from the start, so startup cost does not grow with
+        the size of the on-disk history.
+
+        Args:
+            path: Path to the JSONL history file.
+            limit: Maximum number of records to load.
+        """
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                window = min(size, limit * 1024)
+                f.seek(size - window)
+                lines = f.read().splitlines()
+        except OSError:
+            return
+
+        if window < size and lines:
+            # The window may start mid-record; drop the partial first line
+            lines = lines[1:]
+
+        for line in lines[-limit:]:
+            try:
+                self.task_history.append(json.loads(line))
+            except ValueError:
+                continue
+
+        if self.task_history:
+            logger.info("Rehydrated %d history records from %s", len(self.task_history), path)
+
+    def _append_history_record(self, record: Dict[str, Any]) -> None:
+        """
+        Append one history record to the JSONL file (best effort).
+
+        Args:
+            record: The task record to persist.
+        """
+        try:
+            with open(self._history_path, "a") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+        except OSError as e:
+            logger.warning("Could not persist history record: %s", e)
+
+    def get_task_result(self, result_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the full result for a history record by its result_id.
+
+        Args:
+            result_id: The result identifier from a task history record.
+
+        Returns:
+            The full execution result, or None if it has been evicted.
+        """
+        return self._full_results.get(result_id)
     
     def get_last_result(self) -> Dict[str, Any]:
         """
@@ -216,6 +439,13 @@ class AgentOrchestrator:
                 "max_iterations": 10,
                 "complexity_threshold": 7
             },
+            "history": {
+                "max_entries": 1000,
+                "storage_path": None
+            },
+            "cache": {
+                "ttl": 300
+            },
             "memory": {
                 "short_term": {
                     "capacity": 1000,
@@ -241,28 +471,116 @@ class AgentOrchestrator:
         
         # Check if config file exists
         if not os.path.exists(config_path):
-            logger.warning(f"Config file {config_path} not found. Using default configuration.")
+            logger.warning("Config file %s not found. Using default configuration.", config_path)
             logger.info("JAFS is running with default settings. It might be limited for complex tasks.")
+            self._config_stat = None
+            self.config_pretty = json.dumps(default_config, indent=2, default=str)
             return default_config
-        
+
         try:
-            # Load the config file
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-            
+            stat_result = os.stat(config_path)
+            self._config_stat = (stat_result.st_mtime, stat_result.st_size)
+
+            # Fast path: a JSON sidecar caches the parsed YAML keyed by the
+            # file's mtime and size; JSON parsing is C-level and much
+            # cheaper than a YAML parse on every startup
+            config = self._read_cached_config(config_path, stat_result)
+            if config is None:
+                # Load the config file
+                with open(config_path, "r") as f:
+                    config = yaml.load(f, Loader=_YamlLoader)
+                self._write_cached_config(config_path, stat_result, config)
+
             # Merge with default config
             merged_config = self._merge_configs(default_config, config)
             
             logger.info("JAFS configuration loaded successfully")
             if merged_config.get("agent", {}).get("mode") == "multi":
                 logger.info("JAFS is configured for multi-agent mode - multiple agents will collaborate!")
-            
+
+            # Pre-render the pretty form once; the CLI config command
+            # serves it without re-serializing on every call
+            self.config_pretty = json.dumps(merged_config, indent=2, default=str)
             return merged_config
         except Exception as e:
-            logger.error(f"Error loading config file: {e}")
+            logger.error("Error loading config file: %s", e)
             logger.info("JAFS reverted to default configuration. Performance may not be optimal.")
+            self.config_pretty = json.dumps(default_config, indent=2, default=str)
             return default_config
     
+    def reload_config_if_changed(self) -> bool:
+        """
+        Reload the configuration if the file changed on disk.
+
+        A single os.stat call gates the reload, so the common unchanged
+        case skips the YAML parse and deep-merge entirely.
+
+        Returns:
+            True if the configuration was reloaded, False otherwise.
+        """
+        try:
+            stat_result = os.stat(self.config_path)
+            current = (stat_result.st_mtime, stat_result.st_size)
+        except OSError:
+            current = None
+
+        if current == self._config_stat:
+            return False
+
+        logger.info("Config file changed on disk. Reloading JAFS configuration.")
+        self.config = self._load_config(self.config_path)
+        return True
+
+    def _read_cached_config(self, config_path: str, stat_result: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Read the JSON sidecar cache for a config file.
+
+        Args:
+            config_path: Path to the configuration file.
+            stat_result: Current stat of the configuration file.
+
+        Returns:
+            The cached parsed configuration, or None if absent or stale.
+        """
+        try:
+            with open(config_path + ".cache.json", "r") as f:
+                cached = json.load(f)
+            if (cached.get("mtime") == stat_result.st_mtime
+                    and cached.get("size") == stat_result.st_size):
+                return cached.get("config")
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_cached_config(self, config_path: str, stat_result: os.stat_result, config: Dict[str, Any]) -> None:
+        """
+        Write the JSON sidecar cache for a parsed config file (best effort).
+
+        Args:
+            config_path: Path to the configuration file.
+            stat_result: Stat of the configuration file at parse time.
+            config: The parsed configuration to cache.
+        """
+        sidecar = config_path + ".cache.json"
+        # Write to a per-process temp file and rename into place: os.replace
+        # is atomic, so a crash or concurrent startup can never leave a torn
+        # sidecar for the next reader
+        tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({
+                    "mtime": stat_result.st_mtime,
+                    "size": stat_result.st_size,
+                    "config": config
+                }, f)
+            os.replace(tmp_path, sidecar)
+        except (OSError, TypeError):
+            # The cache is purely an optimization; failing to write it is fine
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def _merge_configs(self, default: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge two configuration dictionaries.
@@ -274,14 +592,20 @@ class AgentOrchestrator:
         Returns:
             The merged configuration.
         """
-        result = default.copy()
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
-        
+        # Deep-copy the defaults once, then walk the override with an
+        # explicit stack instead of recursing (no Python frame per nesting
+        # level, no per-level dict copies)
+        result = copy.deepcopy(default)
+        stack = [(result, override)]
+
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
+
         return result
     
     def _create_primary_agent(self) -> HybridAgent:
@@ -294,7 +618,7 @@ class AgentOrchestrator:
         # Get agent config
         agent_config = self.config.get("agent", {})
         name = agent_config.get("name", "jafs")
-        mode = agent_config.get("mode", "single")
+        mode = sys.intern(agent_config.get("mode", _MODE_SINGLE))
         max_iterations = agent_config.get("max_iterations", 10)
         complexity_threshold = agent_config.get("complexity_threshold", 7)
         
@@ -317,16 +641,17 @@ class AgentOrchestrator:
             long_term_memory=long_term_memory
         )
         
-        logger.info(f"Primary agent created. JAFS is ready with {len(enabled_tools)} tools available")
+        logger.info("Primary agent created. JAFS is ready with %d tools available", len(enabled_tools))
         
         # Create specialized agents if in multi mode
-        if mode == "multi" or mode == "auto":
+        if mode == _MODE_MULTI or mode == _MODE_AUTO:
             self._create_specialized_agents(agent)
             logger.info("Multiple specialized agents have been initialized in JAFS")
         
-        # Register the agent
+        # Register the agent (the cached listing is stale now)
         self.agents[name] = agent
-        
+        self._agent_list_cache = None
+
         return agent
     
     def _create_short_term_memory(self) -> ShortTermMemory:
@@ -340,7 +665,7 @@ class AgentOrchestrator:
         capacity = memory_config.get("capacity", 1000)
         ttl = memory_config.get("ttl", 3600)
         
-        logger.debug(f"Initializing JAFS short-term memory with capacity {capacity}")
+        logger.debug("Initializing JAFS short-term memory with capacity %s", capacity)
         return ShortTermMemory(capacity=capacity, ttl=ttl)
     
     def _create_long_term_memory(self) -> Optional[LongTermMemory]:
@@ -361,7 +686,7 @@ class AgentOrchestrator:
         index_in_memory = memory_config.get("index_in_memory", True)
         
         if storage_path:
-            logger.debug(f"JAFS will store long-term memories at: {storage_path}")
+            logger.debug("JAFS will store long-term memories at: %s", storage_path)
         else:
             logger.debug("JAFS will store long-term memories in the default location")
         
@@ -374,19 +699,16 @@ class AgentOrchestrator:
         Args:
             primary_agent: The primary HybridAgent instance.
         """
-        # Default specialized agent roles
-        default_roles = ["researcher", "planner", "executor", "critic"]
-        
         # Get specialized agent configurations
         specialized_config = self.config.get("specialized_agents", {})
-        roles = specialized_config.get("roles", default_roles)
+        roles = specialized_config.get("roles", _DEFAULT_ROLES)
         
         # HybridAgent already has specialized agents initialized
         # We just need to update their configuration if needed
         for role in roles:
             # Skip if the role is not in the primary agent's specialized_agents
             if role not in primary_agent.specialized_agents:
-                logger.warning(f"Role '{role}' not found in HybridAgent's specialized_agents. Skipping.")
+                logger.warning("Role '%s' not found in HybridAgent's specialized_agents. Skipping.", role)
                 continue
                 
             role_config = specialized_config.get(role, {})
@@ -411,8 +733,8 @@ class AgentOrchestrator:
             if "tools" in merged_config:
                 agent.tools = merged_config["tools"]
             
-            logger.debug(f"Updated {role} agent in JAFS")
+            logger.debug("Updated %s agent in JAFS", role)
         
-        logger.info(f"JAFS now contains {len(primary_agent.specialized_agents)} specialized agents working together harmoniously")
+        logger.info("JAFS now contains %d specialized agents working together harmoniously", len(primary_agent.specialized_agents))
         if len(primary_agent.specialized_agents) > 5:
             logger.warning("That's a lot of agents to manage simultaneously. Performance may be affected.")
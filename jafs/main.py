@@ -15,21 +15,26 @@ def main():
     parser.add_argument("--mode", type=str, default="single", choices=["single", "multi"], help="Agent mode")
     parser.add_argument("--task", type=str, help="Task description")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    
+    parser.add_argument("--output", type=str, default="text", choices=["text", "json"],
+                        help="Output format for task results")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the result cache and force a fresh execution")
+
     args = parser.parse_args()
-    
+
     # Initialize the CLI
-    cli = CLI(verbose=args.verbose)
-    
-    # Display welcome message
-    cli.display_welcome()
-    
+    cli = CLI(verbose=args.verbose, output_mode=args.output)
+
+    # Display welcome message (skipped in JSON mode so stdout stays machine-readable)
+    if args.output == "text":
+        cli.display_welcome()
+
     # Initialize the agent orchestrator
     orchestrator = AgentOrchestrator(config_path=args.config)
-    
+
     # If task is provided as argument, execute it
     if args.task:
-        result = orchestrator.execute_task(args.task, mode=args.mode)
+        result = orchestrator.execute_task(args.task, mode=args.mode, use_cache=not args.no_cache)
         cli.display_result(result)
         return
     
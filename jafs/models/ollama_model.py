@@ -6,21 +6,61 @@ Current Date  3/12/2025
 Class
 """
 
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
 import requests
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from anus.models.base.base_model import BaseModel
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available, falling back to stdlib json."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize JSON with orjson when available, falling back to stdlib json."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+# Matches fenced code blocks (```json ... ``` or ``` ... ```), compiled once
+# so responses are scanned in a single pass instead of line by line
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?[ \t]*\n(.*?)```", re.DOTALL)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class OllamaModel(BaseModel):
     """
     Ollama language model implementation.
-    
+
     Provides integration with Ollama's API for text generation and embeddings.
     """
-    
+
+    # (base_url, model_name) pairs already verified against /api/tags, shared
+    # across instances so repeated constructions skip the network round-trip
+    _availability_checked: set = set()
+
+
     def __init__(
         self, 
         model_name: str = "qwq:32b", 
@@ -43,29 +83,191 @@ class OllamaModel(BaseModel):
         
         self.base_url = base_url
         self.api_url = f"{self.base_url}/api"
-        
+
         # Additional Ollama parameters
         self.top_p = kwargs.get("top_p", 1.0)
         self.top_k = kwargs.get("top_k", 40)
         self.repeat_penalty = kwargs.get("repeat_penalty", 1.1)
-        
-        # Check if the model is available
-        self._check_model_availability()
-    
+
+        # Reuse a single client with a connection pool so repeated calls to
+        # the Ollama API keep their TCP connections alive instead of paying
+        # the connect/handshake cost on every request. When httpx is
+        # installed, prefer it with HTTP/2 enabled so concurrent generate and
+        # embedding calls are multiplexed over one connection; otherwise fall
+        # back to a pooled requests.Session over HTTP/1.1 keep-alive.
+        if httpx is not None:
+            try:
+                self.session = httpx.Client(http2=True, timeout=None)
+            except ImportError:
+                # The h2 extra is not installed; plain HTTP/1.1 keep-alive
+                self.session = httpx.Client(timeout=None)
+            self._is_httpx = True
+        else:
+            self._is_httpx = False
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=kwargs.get("pool_connections", 10),
+                pool_maxsize=kwargs.get("pool_maxsize", 10)
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+        # Response caches keyed by content hash. Deterministic generations
+        # (temperature 0) and embedding lookups for repeated text skip the
+        # network round-trip entirely.
+        self.cache_size = kwargs.get("cache_size", 128)
+        self._generate_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        # Async client, created lazily on first agenerate/aget_embedding call
+        self._async_client = None
+
+        # Payload template with the instance defaults, built once and copied
+        # per request instead of reassembling the dict from kwargs each call
+        self._payload_template: Dict[str, Any] = {
+            "model": self.model_name,
+            "prompt": "",
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "top_k": self.top_k,
+            "repeat_penalty": self.repeat_penalty,
+            "stream": False
+        }
+
+        # Check if the model is available, unless an identical model was
+        # already checked by an earlier construction in this process. The
+        # check only logs a warning, so it runs on a background thread and
+        # construction doesn't block on the round-trip.
+        self._availability_thread: Optional[threading.Thread] = None
+        if (self.base_url, self.model_name) not in self._availability_checked:
+            self._availability_checked.add((self.base_url, self.model_name))
+            self._availability_thread = threading.Thread(
+                target=self._check_model_availability,
+                name=f"ollama-check-{self.model_name}",
+                daemon=True
+            )
+            self._availability_thread.start()
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections.
+        """
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+
+    def __del__(self):
+        # Best effort: release pooled connections when the model is
+        # garbage-collected without an explicit close()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _cache_key(*parts: Any) -> str:
+        """
+        Build a cache key from a hash of the given request parts.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _prepare_generate(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        stream: bool,
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Build a generation payload and, for deterministic requests, its cache key.
+
+        Returns:
+            A (payload, cache_key) tuple; cache_key is None when the request
+            is not cacheable (temperature above 0).
+        """
+        # Set parameters
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+
+        # Start from the preallocated template and overwrite only what this
+        # request changes
+        payload = self._payload_template.copy()
+        payload["prompt"] = prompt
+        if stream:
+            payload["stream"] = stream
+        if temperature is not None:
+            payload["temperature"] = temp
+        if "top_p" in kwargs:
+            payload["top_p"] = kwargs["top_p"]
+        if "top_k" in kwargs:
+            payload["top_k"] = kwargs["top_k"]
+        if "repeat_penalty" in kwargs:
+            payload["repeat_penalty"] = kwargs["repeat_penalty"]
+
+        # Add system message if provided
+        if system_message:
+            payload["system"] = system_message
+
+        # Add max tokens if provided
+        if tokens:
+            payload["num_predict"] = tokens
+
+        # Deterministic requests are safe to cache: the same payload always
+        # produces the same completion at temperature 0
+        cache_key = None
+        if temp == 0:
+            cache_key = self._cache_key(self.model_name, payload.get("system"), prompt,
+                                        payload["top_p"], payload["top_k"],
+                                        payload["repeat_penalty"], tokens)
+
+        return payload, cache_key
+
+    def _post(self, endpoint: str, payload: Dict[str, Any]) -> Any:
+        """
+        POST a JSON payload to an API endpoint, serializing on the fast path.
+        """
+        body = _json_dumps(payload)
+        if self._is_httpx:
+            return self.session.post(f"{self.api_url}/{endpoint}", content=body, headers=_JSON_HEADERS)
+        return self.session.post(f"{self.api_url}/{endpoint}", data=body, headers=_JSON_HEADERS)
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Optional[Any]:
+        """
+        Look up a key in an LRU cache, refreshing its recency on a hit.
+        """
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        return None
+
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any) -> None:
+        """
+        Store a value in an LRU cache, evicting the oldest entry when full.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
     def _check_model_availability(self):
         """
         Check if the specified model is available in Ollama.
+
+        Probes /api/show for just this model instead of downloading the full
+        model list (with metadata) from /api/tags.
         """
         try:
-            response = requests.get(f"{self.api_url}/tags")
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                model_names = [model.get("name") for model in models]
-                
-                if self.model_name not in model_names:
-                    logging.warning(f"Model '{self.model_name}' not found in Ollama. Available models: {model_names}")
-            else:
-                logging.warning(f"Failed to check Ollama models: {response.status_code} {response.text}")
+            response = self._post("show", {"name": self.model_name})
+            if response.status_code == 404:
+                logging.warning(f"Model '{self.model_name}' not found in Ollama. Pull it with: ollama pull {self.model_name}")
+            elif response.status_code != 200:
+                logging.warning(f"Failed to check Ollama model: {response.status_code} {response.text}")
         except Exception as e:
             logging.warning(f"Error checking Ollama model availability: {e}")
     
@@ -79,54 +281,109 @@ class OllamaModel(BaseModel):
     ) -> str:
         """
         Generate text based on a prompt using Ollama.
-        
+
         Args:
             prompt: The text prompt for generation.
             system_message: Optional system message for the model.
             temperature: Controls randomness in outputs. Overrides instance value if provided.
             max_tokens: Maximum number of tokens to generate. Overrides instance value if provided.
-            **kwargs: Additional Ollama-specific parameters.
-            
+            **kwargs: Additional Ollama-specific parameters. Pass stream=True
+                to read the response incrementally as it is generated, and
+                optionally on_token (a callable taking each text chunk) to
+                observe tokens as they arrive.
+
         Returns:
             The generated text response.
         """
-        # Set parameters
-        temp = temperature if temperature is not None else self.temperature
-        tokens = max_tokens if max_tokens is not None else self.max_tokens
-        
-        # Prepare the request payload
-        payload = {
-            "model": self.model_name,
-            "prompt": prompt,
-            "temperature": temp,
-            "top_p": kwargs.get("top_p", self.top_p),
-            "top_k": kwargs.get("top_k", self.top_k),
-            "repeat_penalty": kwargs.get("repeat_penalty", self.repeat_penalty),
-            "stream": False
-        }
-        
-        # Add system message if provided
-        if system_message:
-            payload["system"] = system_message
-        
-        # Add max tokens if provided
-        if tokens:
-            payload["num_predict"] = tokens
-        
+        stream = kwargs.get("stream", False)
+        on_token = kwargs.get("on_token")
+
+        # Prepare the request payload and deterministic cache key
+        payload, cache_key = self._prepare_generate(
+            prompt, system_message, temperature, max_tokens, stream, kwargs
+        )
+
+        if cache_key is not None:
+            cached = self._cache_get(self._generate_cache, cache_key)
+            if cached is not None:
+                # A streaming caller may render purely from the callback,
+                # so a cached result is still delivered through it
+                if stream and on_token is not None:
+                    on_token(cached)
+                return cached
+
         try:
-            # Make the API call
-            response = requests.post(f"{self.api_url}/generate", json=payload)
-            
-            if response.status_code == 200:
-                return response.json().get("response", "")
+            if stream:
+                result = self._stream_generate(payload, on_token=on_token)
             else:
-                error_msg = f"Ollama API error: {response.status_code} {response.text}"
-                logging.error(error_msg)
-                return f"Error: {error_msg}"
-        
+                # Make the API call
+                response = self._post("generate", payload)
+
+                if response.status_code != 200:
+                    error_msg = f"Ollama API error: {response.status_code} {response.text}"
+                    logging.error(error_msg)
+                    return f"Error: {error_msg}"
+
+                result = _json_loads(response.content).get("response", "")
+
+            if cache_key is not None and not result.startswith("Error:"):
+                self._cache_put(self._generate_cache, cache_key, result)
+            return result
+
         except Exception as e:
             logging.error(f"Error generating with Ollama: {e}")
             return f"Error: {str(e)}"
+
+    def _stream_generate(self, payload: Dict[str, Any], on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Stream a generation response, parsing each JSON chunk as it arrives.
+
+        Cuts time-to-first-token and avoids buffering the full response body:
+        each line is decoded incrementally and text chunks are handed to the
+        optional on_token callback as they come in.
+
+        Args:
+            payload: The prepared request payload (with "stream" set to True).
+            on_token: Optional callable invoked with each text chunk.
+
+        Returns:
+            The full generated text, joined from the streamed chunks.
+        """
+        chunks: List[str] = []
+
+        def consume(line: Union[str, bytes]) -> bool:
+            """Parse one streamed JSON line; return True when generation is done."""
+            if not line:
+                return False
+            data = _json_loads(line)
+            token = data.get("response", "")
+            if token:
+                chunks.append(token)
+                if on_token:
+                    on_token(token)
+            return bool(data.get("done"))
+
+        if httpx is not None and isinstance(self.session, httpx.Client):
+            with self.session.stream("POST", f"{self.api_url}/generate", content=_json_dumps(payload), headers=_JSON_HEADERS) as response:
+                if response.status_code != 200:
+                    response.read()
+                    error_msg = f"Ollama API error: {response.status_code} {response.text}"
+                    logging.error(error_msg)
+                    return f"Error: {error_msg}"
+                for line in response.iter_lines():
+                    if consume(line):
+                        break
+        else:
+            response = self.session.post(f"{self.api_url}/generate", data=_json_dumps(payload), headers=_JSON_HEADERS, stream=True)
+            if response.status_code != 200:
+                error_msg = f"Ollama API error: {response.status_code} {response.text}"
+                logging.error(error_msg)
+                return f"Error: {error_msg}"
+            for line in response.iter_lines():
+                if consume(line):
+                    break
+
+        return "".join(chunks)
     
     def generate_with_tools(
         self, 
@@ -198,38 +455,28 @@ If you don't need to use a tool, respond normally.
             **kwargs
         )
         
-        # Try to extract tool calls from the response
+        # Try to extract tool calls from the response. Each block carries its
+        # match span so consumed blocks can be cut out of the content by
+        # slicing, in one pass, instead of a str.replace scan per block.
         tool_calls = []
-        content = response_text
-        
+        consumed_spans = []
+
         # Look for JSON blocks in the response
-        json_blocks = []
-        in_json_block = False
-        json_content = ""
-        
-        for line in response_text.split("\n"):
-            if line.strip() == "```json" or line.strip() == "```":
-                if in_json_block:
-                    in_json_block = False
-                    json_blocks.append(json_content)
-                    json_content = ""
-                else:
-                    in_json_block = True
-            elif in_json_block:
-                json_content += line + "\n"
-        
-        # Also try to parse the entire response as JSON
+        json_blocks = [(match.group(1), match.span()) for match in _JSON_BLOCK_RE.finditer(response_text)]
+
+        # Also try to parse the entire response as JSON (no span: the raw
+        # text stays in the content, matching the previous behavior)
         if not json_blocks:
             try:
-                json_data = json.loads(response_text)
-                json_blocks.append(json.dumps(json_data))
+                _json_loads(response_text)
+                json_blocks.append((response_text, None))
             except:
                 pass
-        
+
         # Process each JSON block
-        for json_block in json_blocks:
+        for json_block, span in json_blocks:
             try:
-                data = json.loads(json_block)
+                data = _json_loads(json_block)
                 if "tool_calls" in data:
                     for tool_call in data["tool_calls"]:
                         normalized_tool_call = {
@@ -238,13 +485,24 @@ If you don't need to use a tool, respond normally.
                             "arguments": tool_call.get("arguments", {})
                         }
                         tool_calls.append(normalized_tool_call)
-                    
-                    # Remove the JSON block from the content
-                    content = content.replace(f"```json\n{json_block}\n```", "")
-                    content = content.replace(f"```\n{json_block}\n```", "")
+
+                    if span is not None:
+                        consumed_spans.append(span)
             except:
                 continue
-        
+
+        # Rebuild the content from the slices around consumed blocks
+        if consumed_spans:
+            pieces = []
+            last_end = 0
+            for start, end in consumed_spans:
+                pieces.append(response_text[last_end:start])
+                last_end = end
+            pieces.append(response_text[last_end:])
+            content = "".join(pieces)
+        else:
+            content = response_text
+
         return {
             "content": content.strip(),
             "tool_calls": tool_calls
@@ -292,35 +550,22 @@ If you don't need to use a tool, respond normally.
         # Try to extract JSON from the response
         try:
             # First, try to parse the entire response as JSON
-            return json.loads(response_text)
+            return _json_loads(response_text)
         except json.JSONDecodeError:
             # If that fails, look for JSON blocks
             for line in response_text.split("\n"):
                 if line.strip().startswith("{") and line.strip().endswith("}"):
                     try:
-                        return json.loads(line.strip())
+                        return _json_loads(line.strip())
                     except:
                         continue
             
             # If still no valid JSON, look for code blocks
-            json_blocks = []
-            in_json_block = False
-            json_content = ""
-            
-            for line in response_text.split("\n"):
-                if line.strip() == "```json" or line.strip() == "```":
-                    if in_json_block:
-                        in_json_block = False
-                        json_blocks.append(json_content)
-                        json_content = ""
-                    else:
-                        in_json_block = True
-                elif in_json_block:
-                    json_content += line + "\n"
-            
+            json_blocks = [match.group(1) for match in _JSON_BLOCK_RE.finditer(response_text)]
+
             for json_block in json_blocks:
                 try:
-                    return json.loads(json_block)
+                    return _json_loads(json_block)
                 except:
                     continue
             
@@ -339,22 +584,186 @@ If you don't need to use a tool, respond normally.
         Returns:
             The embedding vector as a list of floats.
         """
+        # Embeddings are deterministic for a given model and text
+        cache_key = self._cache_key(self.model_name, text)
+        cached = self._cache_get(self._embedding_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Prepare the request payload
             payload = {
                 "model": self.model_name,
                 "prompt": text,
             }
-            
+
             # Make the API call
-            response = requests.post(f"{self.api_url}/embeddings", json=payload)
-            
+            response = self._post("embeddings", payload)
+
             if response.status_code == 200:
-                return response.json().get("embedding", [])
+                embedding = _json_loads(response.content).get("embedding", [])
+                if embedding:
+                    self._cache_put(self._embedding_cache, cache_key, embedding)
+                return embedding
             else:
                 logging.error(f"Ollama API error: {response.status_code} {response.text}")
                 return []
-        
+
+        except Exception as e:
+            logging.error(f"Error generating embedding with Ollama: {e}")
+            return []
+
+    def get_embeddings(self, texts: List[str], max_workers: int = 4, **kwargs) -> List[List[float]]:
+        """
+        Generate embedding vectors for multiple texts concurrently.
+
+        Issues the per-text requests in parallel over the pooled connection
+        instead of serially round-tripping one text at a time. Results keep
+        the order of the input texts, and cached texts are served from the
+        embedding cache without a request.
+
+        Args:
+            texts: The texts to embed.
+            max_workers: Maximum number of concurrent requests.
+            **kwargs: Additional Ollama-specific parameters.
+
+        Returns:
+            A list of embedding vectors, one per input text.
+        """
+        if not texts:
+            return []
+
+        if len(texts) == 1:
+            return [self.get_embedding(texts[0], **kwargs)]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(lambda text: self.get_embedding(text, **kwargs), texts))
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        Return the lazily-created shared httpx.AsyncClient.
+
+        Raises:
+            RuntimeError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise RuntimeError("httpx is required for async Ollama calls. Install it with: pip install httpx")
+
+        if self._async_client is None:
+            try:
+                self._async_client = httpx.AsyncClient(http2=True, timeout=None)
+            except ImportError:
+                # The h2 extra is not installed; plain HTTP/1.1 keep-alive
+                self._async_client = httpx.AsyncClient(timeout=None)
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """
+        Close the lazily-created async client, if one was created.
+
+        Call from within the running event loop; the next async call
+        creates a fresh client.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> str:
+        """
+        Asynchronously generate text based on a prompt using Ollama.
+
+        Mirrors generate() but awaits the request on a shared
+        httpx.AsyncClient, so agents can issue several generations
+        concurrently with asyncio.gather.
+
+        Args:
+            prompt: The text prompt for generation.
+            system_message: Optional system message for the model.
+            temperature: Controls randomness in outputs. Overrides instance value if provided.
+            max_tokens: Maximum number of tokens to generate. Overrides instance value if provided.
+            **kwargs: Additional Ollama-specific parameters.
+
+        Returns:
+            The generated text response.
+        """
+        payload, cache_key = self._prepare_generate(
+            prompt, system_message, temperature, max_tokens, False, kwargs
+        )
+
+        if cache_key is not None:
+            cached = self._cache_get(self._generate_cache, cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            client = self._get_async_client()
+            response = await client.post(
+                f"{self.api_url}/generate",
+                content=_json_dumps(payload),
+                headers=_JSON_HEADERS
+            )
+
+            if response.status_code != 200:
+                error_msg = f"Ollama API error: {response.status_code} {response.text}"
+                logging.error(error_msg)
+                return f"Error: {error_msg}"
+
+            result = _json_loads(response.content).get("response", "")
+
+            if cache_key is not None:
+                self._cache_put(self._generate_cache, cache_key, result)
+            return result
+
+        except Exception as e:
+            logging.error(f"Error generating with Ollama: {e}")
+            return f"Error: {str(e)}"
+
+    async def aget_embedding(self, text: str, **kwargs) -> List[float]:
+        """
+        Asynchronously generate an embedding vector for the given text.
+
+        Args:
+            text: The text to embed.
+            **kwargs: Additional Ollama-specific parameters.
+
+        Returns:
+            The embedding vector as a list of floats.
+        """
+        cache_key = self._cache_key(self.model_name, text)
+        cached = self._cache_get(self._embedding_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            payload = {
+                "model": self.model_name,
+                "prompt": text,
+            }
+
+            client = self._get_async_client()
+            response = await client.post(
+                f"{self.api_url}/embeddings",
+                content=_json_dumps(payload),
+                headers=_JSON_HEADERS
+            )
+
+            if response.status_code == 200:
+                embedding = _json_loads(response.content).get("embedding", [])
+                if embedding:
+                    self._cache_put(self._embedding_cache, cache_key, embedding)
+                return embedding
+            else:
+                logging.error(f"Ollama API error: {response.status_code} {response.text}")
+                return []
+
         except Exception as e:
             logging.error(f"Error generating embedding with Ollama: {e}")
             return []
@@ -4,18 +4,89 @@ Command-line interface for the JAFS framework.
 Remember: With great JAFS comes great responsibility.
 """
 
+import functools
 import os
 import sys
 import time
 import json
 import logging
 import cmd
-import shutil
+import signal
 import random
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Union, TYPE_CHECKING
 
-from jafs.core.orchestrator import AgentOrchestrator
+# The orchestrator drags in yaml, the agent hierarchy, and the memory
+# stack; it is imported lazily on first use so that merely importing the
+# CLI (and one-shot invocations that error out early) don't pay for it
+if TYPE_CHECKING:
+    from jafs.core.orchestrator import AgentOrchestrator
+
+try:
+    # orjson serializes several times faster than stdlib json (C implementation)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Valid execution modes (frozenset: O(1) membership probe)
+_MODES = frozenset(("single", "multi", "auto"))
+
+# Payloads whose compact serialization exceeds this are shown compact:
+# indent=2 pretty printing is markedly slower on large nested contexts
+_PRETTY_SIZE_LIMIT = 64 * 1024
+
+def _dumps(data: Any, pretty: bool) -> str:
+    """
+    Serialize data to JSON, preferring orjson when available.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option, default=str).decode()
+    if pretty:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+# Dedicated RNG for UI flavor: keeps joke picks off the shared global
+# random instance (and its lock) used by the rest of the process
+_rng = random.Random()
+
+# Terminal layout is cached so display helpers don't issue a terminal-size
+# ioctl and rebuild the separator string on every command. The cache is
+# invalidated when the terminal is resized.
+_term_cache: Optional[Tuple[int, str]] = None
+
+def _term_layout() -> Tuple[int, str]:
+    """
+    Return the terminal (width, separator line), cached until resize.
+    """
+    global _term_cache
+    if _term_cache is None:
+        import shutil
+        width = shutil.get_terminal_size().columns
+        _term_cache = (width, "=" * width)
+    return _term_cache
+
+def _invalidate_term_cache(signum=None, frame=None) -> None:
+    """
+    Drop the cached terminal layout (installed as the SIGWINCH handler).
+    """
+    global _term_cache
+    _term_cache = None
+
+try:
+    signal.signal(signal.SIGWINCH, _invalidate_term_cache)
+except (AttributeError, ValueError):
+    # No SIGWINCH on this platform, or not running on the main thread
+    pass
+
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp(seconds: int) -> str:
+    """
+    Format an integer-second timestamp for history display, memoized.
+
+    History rows often share the same second, so repeat formats are
+    dictionary hits instead of strftime calls.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
 
 class CLI(cmd.Cmd):
     """
@@ -33,8 +104,8 @@ class CLI(cmd.Cmd):
     intro = "Welcome to the JAFS framework. Type help or ? to list commands."
     prompt = "jafs> "
     
-    # Easter egg jokes for random display
-    _jafs_jokes = [
+    # Easter egg jokes for random display (tuple: indexed, never mutated)
+    _jafs_jokes = (
         "JAFS: Because 'Jarvis Agent Framework System' sounds better in meetings.",
         "JAFS: The intelligent system that handles all your tasks.",
         "JAFS: Boldly going where no framework has gone before.",
@@ -45,23 +116,29 @@ class CLI(cmd.Cmd):
         "JAFS: Seamless integration with your backend systems.",
         "JAFS: Because 'JARVIS' was already taken as an acronym.",
         "JAFS: Making developers productive in meetings since 2023."
-    ]
+    )
     
-    def __init__(self, verbose: bool = False, config_path: str = "config.yaml"):
+    def __init__(self, verbose: bool = False, config_path: str = "config.yaml",
+                 output_mode: str = "text"):
         """
         Initialize a CLI instance.
-        
+
         Args:
             verbose: Whether to enable verbose output.
             config_path: Path to the configuration file.
+            output_mode: Result output format ("text" or "json").
         """
         super().__init__()
         self.verbose = verbose
         self.config_path = config_path
+        self.output_mode = output_mode
         self.orchestrator = None
         self.current_result = None
         self.history = []
         self.joke_counter = 0  # Track number of commands for occasional jokes
+        # Banners and jokes are decoration for humans at a terminal; skip
+        # them when output is piped or machine-readable
+        self._decorate = output_mode == "text" and sys.stdout.isatty()
         
         # Set up logging
         log_level = logging.DEBUG if verbose else logging.INFO
@@ -69,6 +146,22 @@ class CLI(cmd.Cmd):
             level=log_level,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
+
+    def _ensure_orchestrator(self) -> "AgentOrchestrator":
+        """
+        Return the orchestrator, creating it (and importing its module)
+        on first use.
+        """
+        if not self.orchestrator:
+            from jafs.core.orchestrator import AgentOrchestrator
+            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
+        return self.orchestrator
+
+    def _random_joke(self) -> str:
+        """
+        Pick a random JAFS joke via the dedicated RNG.
+        """
+        return self._jafs_jokes[_rng.randrange(len(self._jafs_jokes))]
     
     def display_welcome(self) -> None:
         """
@@ -76,28 +169,32 @@ class CLI(cmd.Cmd):
         
         Includes a random JAFS joke to brighten your day.
         """
-        term_width = shutil.get_terminal_size().columns
-        
-        print("=" * term_width)
+        # Banner is decoration: skip it when output is piped or JSON
+        if not self._decorate:
+            return
+
+        term_width, separator = _term_layout()
+
+        print(separator)
         print("JAFS - Jarvis Agent Framework System".center(term_width))
-        print("=" * term_width)
-        print(random.choice(self._jafs_jokes).center(term_width))
-        print("=" * term_width)
+        print(separator)
+        print(self._random_joke().center(term_width))
+        print(separator)
         print("Type 'help' or '?' to list available commands.".center(term_width))
-        print("=" * term_width)
+        print(separator)
         print()
     
-    def start_interactive_mode(self, orchestrator: Optional[AgentOrchestrator] = None) -> None:
+    def start_interactive_mode(self, orchestrator: Optional["AgentOrchestrator"] = None) -> None:
         """
         Start the interactive command-line interface.
-        
+
         Args:
             orchestrator: Optional orchestrator instance. If not provided, one will be created.
         """
         if orchestrator:
             self.orchestrator = orchestrator
         else:
-            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
+            self._ensure_orchestrator()
         
         # Display welcome message if not in stdin mode
         if sys.stdin.isatty():
@@ -106,6 +203,34 @@ class CLI(cmd.Cmd):
         # Start the command loop
         self.cmdloop()
     
+    def cmdloop(self, intro: Optional[str] = None) -> None:
+        """
+        Run the command loop.
+
+        When stdin is not a terminal (piped scripts), the whole input is
+        read with one buffered call and dispatched line by line, skipping
+        cmd.Cmd's per-line input()/readline machinery.
+        """
+        if sys.stdin.isatty():
+            super().cmdloop(intro)
+            return
+
+        self.preloop()
+        try:
+            stop = None
+            for line in sys.stdin.read().splitlines():
+                line = self.precmd(line)
+                stop = self.onecmd(line)
+                stop = self.postcmd(stop, line)
+                if stop:
+                    break
+            if not stop:
+                # Input exhausted: same behavior as input() raising EOFError
+                line = self.precmd("EOF")
+                self.postcmd(self.onecmd(line), line)
+        finally:
+            self.postloop()
+
     def display_result(self, result: Dict[str, Any]) -> None:
         """
         Display the result of a task execution.
@@ -114,50 +239,58 @@ class CLI(cmd.Cmd):
             result: The task execution result.
         """
         self.current_result = result
-        
-        term_width = shutil.get_terminal_size().columns
-        
-        print("\n" + "=" * term_width)
-        print("TASK RESULT".center(term_width))
-        print("=" * term_width)
-        
+
+        # Machine-readable path: one compact JSON blob, no banners, no
+        # terminal-size probing, no jokes
+        if self.output_mode == "json":
+            sys.stdout.write(json.dumps(result, default=str) + "\n")
+            return
+
+        term_width, separator = _term_layout()
+
+        # Build the whole report in memory and emit it with a single write:
+        # one buffered syscall instead of a flush per print() call
+        lines = ["", separator, "TASK RESULT".center(term_width), separator]
+
         # Display the task
         task = result.get("task", "Unknown task")
-        print(f"Task: {task}")
-        
+        lines.append(f"Task: {task}")
+
         # Display the answer
         answer = result.get("answer", "No answer provided")
-        print("\nAnswer:")
-        print(f"{answer}")
-        
+        lines.append("\nAnswer:")
+        lines.append(f"{answer}")
+
         # Display additional information if verbose
         if self.verbose:
-            print("\nExecution Details:")
-            
+            lines.append("\nExecution Details:")
+
             # Mode
             mode = result.get("mode", "single")
-            print(f"Mode: {mode}")
-            
+            lines.append(f"Mode: {mode}")
+
             # Steps or iterations
             if "iterations" in result:
                 iterations = result.get("iterations", 0)
-                print(f"Iterations: {iterations}")
+                lines.append(f"Iterations: {iterations}")
             elif "steps" in result:
                 steps = len(result.get("steps", []))
                 completed_steps = len(result.get("completed_steps", []))
-                print(f"Steps: {completed_steps}/{steps} completed")
-            
+                lines.append(f"Steps: {completed_steps}/{steps} completed")
+
             # Display context or not based on verbosity
             if self.verbose and "context" in result:
-                print("\nExecution Context:")
-                self._pretty_print(result["context"])
-        
-        print("=" * term_width)
-        
-        # Occasionally show a joke after results
+                lines.append("\nExecution Context:")
+                lines.append(self._format_data(result["context"]))
+
+        lines.append(separator)
+
+        # Occasionally show a joke after results (terminal sessions only)
         self.joke_counter += 1
-        if self.joke_counter % 3 == 0:  # Every 3rd result
-            print(f"\nJAFS Wisdom: {random.choice(self._jafs_jokes)}")
+        if self._decorate and self.joke_counter % 3 == 0:  # Every 3rd result
+            lines.append(f"\nJAFS Wisdom: {self._random_joke()}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def do_task(self, arg: str) -> None:
         """
@@ -169,24 +302,22 @@ class CLI(cmd.Cmd):
             arg: Task description and optional mode.
         """
         # Make sure orchestrator is initialized
-        if not self.orchestrator:
-            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
-        
-        # Parse arguments
-        parts = arg.strip().split(maxsplit=1)
-        
-        if len(parts) == 0 or not arg.strip():
+        self._ensure_orchestrator()
+
+        # Parse arguments (strip and split once)
+        stripped = arg.strip()
+
+        if not stripped:
             print("Error: Please provide a task description.")
             print("JAFS can't work with nothing. It needs a task to process.")
             return
-        
+
         # Check if mode is specified
-        mode = None
-        task = arg.strip()
-        
-        if len(parts) > 1 and parts[0] in ["single", "multi", "auto"]:
-            mode = parts[0]
-            task = parts[1]
+        parts = stripped.split(maxsplit=1)
+        if len(parts) > 1 and parts[0] in _MODES:
+            mode, task = parts
+        else:
+            mode, task = None, stripped
         
         # Execute the task
         print(f"Executing task: {task}")
@@ -219,9 +350,8 @@ class CLI(cmd.Cmd):
         Usage: agents
         """
         # Make sure orchestrator is initialized
-        if not self.orchestrator:
-            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
-        
+        self._ensure_orchestrator()
+
         agents = self.orchestrator.list_agents()
         
         if not agents:
@@ -271,30 +401,34 @@ class CLI(cmd.Cmd):
             print("JAFS has no history to report yet.")
             return
         
-        print("Task History:")
-        print("-" * 60)
-        
+        # Collect the listing and emit it with a single buffered write
+        lines = ["Task History:", "-" * 60]
+
         for i, entry in enumerate(reversed(history)):
             timestamp = entry.get("start_time", entry.get("timestamp", 0))
-            dt = datetime.fromtimestamp(timestamp)
             task = entry.get("task", "Unknown task")
             mode = entry.get("mode", "single")
             status = entry.get("status", "completed")
-            
-            print(f"{i+1}. [{dt.strftime('%Y-%m-%d %H:%M:%S')}] ({mode}) {status}")
-            print(f"   Task: {task}")
-            
-            # Show result summary if available
-            if "result" in entry and "answer" in entry["result"]:
-                answer = entry["result"]["answer"]
+
+            lines.append(f"{i+1}. [{_format_timestamp(int(timestamp))}] ({mode}) {status}")
+            lines.append(f"   Task: {task}")
+
+            # Show result summary if available (orchestrator records carry a
+            # pre-truncated "answer"; the CLI's own records embed "result")
+            answer = entry.get("answer")
+            if answer is None and "result" in entry:
+                answer = entry["result"].get("answer")
+            if answer:
                 summary = answer[:100] + "..." if len(answer) > 100 else answer
-                print(f"   Answer: {summary}")
-            
-            print()
-        
-        print(f"Showing {min(len(history), limit)} of {len(history)} total entries.")
+                lines.append(f"   Answer: {summary}")
+
+            lines.append("")
+
+        lines.append(f"Showing {min(len(history), limit)} of {len(history)} total entries.")
         if len(history) > 10:
-            print("JAFS has been quite productive, hasn't it?")
+            lines.append("JAFS has been quite productive, hasn't it?")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def do_config(self, arg: str) -> None:
         """
@@ -303,13 +437,18 @@ class CLI(cmd.Cmd):
         Usage: config
         """
         # Make sure orchestrator is initialized
-        if not self.orchestrator:
-            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
-        
+        self._ensure_orchestrator()
+
+        # Pick up on-disk edits (a single stat call when nothing changed)
+        if self.orchestrator.reload_config_if_changed():
+            print("Configuration file changed on disk; reloaded.")
+
         print(f"Configuration file: {self.config_path}")
         print("-" * 60)
-        
-        self._pretty_print(self.orchestrator.config)
+
+        # The formatted config is precomputed at load time, so displaying
+        # it is a straight write with no per-call serialization
+        print(self.orchestrator.config_pretty)
         print("\nProTip: A well-configured JAFS is a productive JAFS.")
     
     def do_joke(self, arg: str) -> None:
@@ -318,16 +457,16 @@ class CLI(cmd.Cmd):
         
         Usage: joke
         """
-        joke = random.choice(self._jafs_jokes)
-        
-        term_width = shutil.get_terminal_size().columns
+        joke = self._random_joke()
         
+        term_width, separator = _term_layout()
+
         print()
-        print("=" * term_width)
+        print(separator)
         print("JAFS WISDOM".center(term_width))
-        print("=" * term_width)
+        print(separator)
         print(joke.center(term_width))
-        print("=" * term_width)
+        print(separator)
         print()
     
     def do_exit(self, arg: str) -> bool:
@@ -358,21 +497,36 @@ class CLI(cmd.Cmd):
         """
         Handle empty lines in the CLI.
         """
-        # 1 in 10 chance to show a joke on empty line
-        if random.random() < 0.1:
-            print(f"JAFS is waiting... {random.choice(self._jafs_jokes)}")
+        # 1 in 10 chance to show a joke on empty line (terminal sessions only)
+        if self._decorate and _rng.random() < 0.1:
+            print(f"JAFS is waiting... {self._random_joke()}")
     
+    def _format_data(self, data: Any) -> str:
+        """
+        Format data for display.
+
+        Args:
+            data: Data to format.
+
+        Returns:
+            The formatted string.
+        """
+        if isinstance(data, (dict, list)):
+            # Serialize compact first (the cheap form); only re-dump with
+            # indentation when the payload is small enough that pretty
+            # printing stays fast. default=str means serialization never
+            # raises on datetimes/UUIDs, so no try/except is needed.
+            compact = _dumps(data, pretty=False)
+            if len(compact) > _PRETTY_SIZE_LIMIT:
+                return compact
+            return _dumps(data, pretty=True)
+        return str(data)
+
     def _pretty_print(self, data: Any) -> None:
         """
         Pretty print data.
-        
+
         Args:
             data: Data to print.
         """
-        if isinstance(data, (dict, list)):
-            try:
-                print(json.dumps(data, indent=2))
-            except Exception:
-                print(data)
-        else:
-            print(data)
+        print(self._format_data(data))